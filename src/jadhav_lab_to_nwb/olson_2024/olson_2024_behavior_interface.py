@@ -49,15 +49,16 @@ class Olson2024BehaviorInterface(BaseDataInterface):
             name=metadata["Behavior"]["Module"]["name"],
             description=metadata["Behavior"]["Module"]["description"],
         )
+        id_to_event_metadata = {
+            event_metadata["id"]: event_metadata for event_metadata in metadata["Behavior"]["Events"]
+        }
         for file_path in folder_path.glob(r"*.dat"):
             fieldsText = readTrodesExtractedDataFile(file_path)
             rate = np.asarray(fieldsText["clockrate"], dtype="float64")
             timestamps = fieldsText["data"]["time"][fieldsText["data"]["state"] == 1]
             timestamps = np.asarray(timestamps, dtype="float64") / rate
             event_id = fieldsText["id"]
-            event_metadata = next(
-                event_metadata for event_metadata in metadata["Behavior"]["Events"] if event_metadata["id"] == event_id
-            )
+            event_metadata = id_to_event_metadata[event_id]
             event = Events(
                 name=event_metadata["name"],
                 description=event_metadata["description"],
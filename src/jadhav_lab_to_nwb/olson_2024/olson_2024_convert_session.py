@@ -10,6 +10,7 @@ from ndx_pose import (
 from neuroconv.utils import load_dict_from_file, dict_deep_update
 
 from jadhav_lab_to_nwb.olson_2024 import Olson2024NWBConverter
+from jadhav_lab_to_nwb.olson_2024.tools.spikegadgets import readCameraModuleTimeStamps
 
 
 def get_start_datetime(epoch_folder_name: str) -> datetime:
@@ -43,8 +44,7 @@ def session_to_nwb(
     nwbfile_path = output_dir_path / f"sub-{subject_id}_ses-{session_id}.nwb"
 
     # Get epoch info
-    epoch_folder_paths = list(session_folder_path.glob(rf"{session_folder_path.name}_S[0-9][0-9]_F[0-9][0-9]_*"))
-    epoch_folder_paths = sorted(epoch_folder_paths)
+    epoch_folder_paths = sorted(session_folder_path.glob(rf"{session_folder_path.name}_S[0-9][0-9]_F[0-9][0-9]_*"))
 
     source_data = dict()
     conversion_options = dict()
@@ -103,22 +103,27 @@ def session_to_nwb(
     source_data.update(dict(Epoch=dict(epoch_folder_paths=epoch_folder_paths)))
     conversion_options.update(dict(Epoch=dict()))
 
-    converter = Olson2024NWBConverter(source_data=source_data)
-    metadata = converter.get_metadata()
+    # readCameraModuleTimeStamps is cached so each timestamps file is parsed once per conversion;
+    # clear it afterwards so arrays from this session don't outlive it.
+    try:
+        converter = Olson2024NWBConverter(source_data=source_data)
+        metadata = converter.get_metadata()
 
-    # Add datetime to conversion
-    session_start_time = get_start_datetime(epoch_folder_paths[0].name)
-    est = ZoneInfo("US/Eastern")
-    session_start_time = session_start_time.replace(tzinfo=est)
-    metadata["NWBFile"]["session_start_time"] = session_start_time
+        # Add datetime to conversion
+        session_start_time = get_start_datetime(epoch_folder_paths[0].name)
+        est = ZoneInfo("US/Eastern")
+        session_start_time = session_start_time.replace(tzinfo=est)
+        metadata["NWBFile"]["session_start_time"] = session_start_time
 
-    # Update default metadata with the editable in the corresponding yaml file
-    editable_metadata_path = Path(__file__).parent / "olson_2024_metadata.yaml"
-    editable_metadata = load_dict_from_file(editable_metadata_path)
-    metadata = dict_deep_update(metadata, editable_metadata)
+        # Update default metadata with the editable in the corresponding yaml file
+        editable_metadata_path = Path(__file__).parent / "olson_2024_metadata.yaml"
+        editable_metadata = load_dict_from_file(editable_metadata_path)
+        metadata = dict_deep_update(metadata, editable_metadata)
 
-    # Run conversion
-    converter.run_conversion(metadata=metadata, nwbfile_path=nwbfile_path, conversion_options=conversion_options)
+        # Run conversion
+        converter.run_conversion(metadata=metadata, nwbfile_path=nwbfile_path, conversion_options=conversion_options)
+    finally:
+        readCameraModuleTimeStamps.cache_clear()
 
 
 if __name__ == "__main__":
@@ -128,8 +133,7 @@ if __name__ == "__main__":
     output_dir_path = Path("/Volumes/T7/CatalystNeuro/Jadhav/conversion_nwb")
     stub_test = True
 
-    if output_dir_path.exists():
-        shutil.rmtree(output_dir_path, ignore_errors=True)
+    shutil.rmtree(output_dir_path, ignore_errors=True)
 
     # Example Session
     subject_id = "SL18"
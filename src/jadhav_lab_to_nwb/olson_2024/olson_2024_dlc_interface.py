@@ -32,16 +32,15 @@ class Olson2024DeepLabCutInterface(BaseDataInterface):
             video_timestamps_file_paths = [None] * len(file_paths)
         msg = "The number of file paths must match the number of config file paths and the number of video_timestamps file paths."
         assert len(file_paths) == len(config_file_paths) == len(video_timestamps_file_paths), msg
-        dlc_interfaces = []
-        for file_path, config_file_path in zip(file_paths, config_file_paths):
-            dlc_interface = DeepLabCutInterface(
+        self.dlc_interfaces = [
+            DeepLabCutInterface(
                 file_path=file_path,
                 config_file_path=config_file_path,
                 subject_name=subject_name,
                 verbose=verbose,
             )
-            dlc_interfaces.append(dlc_interface)
-        self.dlc_interfaces = dlc_interfaces
+            for file_path, config_file_path in zip(file_paths, config_file_paths)
+        ]
         self.video_timestamps_file_paths = video_timestamps_file_paths
 
     def get_metadata(self) -> DeepDict:
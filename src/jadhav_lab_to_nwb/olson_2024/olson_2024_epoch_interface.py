@@ -12,6 +12,19 @@ class Olson2024EpochInterface(BaseDataInterface):
     """Epoch interface for olson_2024 conversion"""
 
     keywords = ("behavior",)
+    _EPOCH_COLUMNS = (
+        ("epoch_name", "Full name of the epoch"),
+        ("epoch_id", "Epoch ID"),
+        ("frag_id", "Frag ID"),  # TODO: What is a frag ID?
+        ("env_id", "Environment ID"),
+        ("task_id", "Task ID"),
+        ("task_name", "Full name of the task"),
+        ("task_description", "Description of the task"),
+        ("camera_id", "Camera ID"),
+        ("led_configuration", "LED configuration"),
+        ("led_list", "Comma-separated list of LEDs"),
+        ("led_positions", "Comma-separated list of LED positions"),
+    )
 
     def __init__(self, epoch_folder_paths: list[DirectoryPath]):
         super().__init__(epoch_folder_paths=epoch_folder_paths)
@@ -50,23 +63,16 @@ class Olson2024EpochInterface(BaseDataInterface):
 
     def add_to_nwbfile(self, nwbfile: NWBFile, metadata: dict):
         epoch_folder_paths = self.source_data["epoch_folder_paths"]
-        nwbfile.add_epoch_column(name="epoch_name", description="Full name of the epoch")
-        nwbfile.add_epoch_column(name="epoch_id", description="Epoch ID")
-        nwbfile.add_epoch_column(name="frag_id", description="Frag ID")  # TODO: What is a frag ID?
-        nwbfile.add_epoch_column(name="env_id", description="Environment ID")
-        nwbfile.add_epoch_column(name="task_id", description="Task ID")
-        nwbfile.add_epoch_column(name="task_name", description="Full name of the task")
-        nwbfile.add_epoch_column(name="task_description", description="Description of the task")
-        nwbfile.add_epoch_column(name="camera_id", description="Camera ID")
-        nwbfile.add_epoch_column(name="led_configuration", description="LED configuration")
-        nwbfile.add_epoch_column(name="led_list", description="Comma-separated list of LEDs")
-        nwbfile.add_epoch_column(name="led_positions", description="Comma-separated list of LED positions")
+        for name, description in self._EPOCH_COLUMNS:
+            nwbfile.add_epoch_column(name=name, description=description)
+        name_to_epoch_metadata = {epoch_metadata["name"]: epoch_metadata for epoch_metadata in metadata["Epochs"]}
+        name_to_task_metadata = {task_metadata["name"]: task_metadata for task_metadata in metadata["Tasks"]}
         for epoch_folder_path in epoch_folder_paths:
             epoch_name = get_epoch_name(epoch_folder_path.name)
             epoch_id, frag_id, env_id, task_id = epoch_name.split("_")
-            epoch_metadata = next(meta for meta in metadata["Epochs"] if meta["name"] == epoch_id)
+            epoch_metadata = name_to_epoch_metadata[epoch_id]
             task_name = epoch_metadata["task_name"]
-            task_metadata = next(meta for meta in metadata["Tasks"] if meta["name"] == task_name)
+            task_metadata = name_to_task_metadata[task_name]
             task_description = task_metadata["description"]
             camera_id = task_metadata["camera_id"]
             led_configuration = epoch_metadata["led_configuration"]
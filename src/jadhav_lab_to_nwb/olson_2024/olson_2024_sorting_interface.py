@@ -40,16 +40,19 @@ class Olson2024SortingInterface(BaseDataInterface):
             unit_stats_df = pd.read_csv(unit_stats_file_path, skiprows=[0], header=None)
             unit_stats_df = unit_stats_df.iloc[:, : len(names)]
             unit_stats_df.columns = names
+            unit_stats_df = unit_stats_df.drop_duplicates(subset="Unit Number").set_index("Unit Number")
             nTrode = int(file_path.name.split("_")[0].split("nt")[1])
             spike_times_df = pd.read_csv(file_path, names=["unitInd", "time"])
-            unitInds = natsorted(spike_times_df["unitInd"].unique())
+            unitInd_to_spike_times = {
+                unitInd: unit_df["time"].to_numpy() for unitInd, unit_df in spike_times_df.groupby("unitInd")
+            }
+            unitInds = natsorted(unitInd_to_spike_times.keys())
             electrode_group = nwbfile.electrode_groups[f"nTrode{nTrode}"]
             for unitInd in unitInds:
-                spike_times = spike_times_df.time[spike_times_df.unitInd == unitInd].to_numpy()
-                unit_stats = unit_stats_df[unit_stats_df["Unit Number"] == unitInd]
-                nWaveforms = unit_stats["Number of Waveforms"].iloc[0]
-                waveformFWHM = unit_stats["Valley FWHM of Unit Template"].iloc[0]
-                waveformPeakMinusTrough = unit_stats["Peak-Valley of Unit Template"].iloc[0]
+                spike_times = unitInd_to_spike_times[unitInd]
+                nWaveforms = unit_stats_df.at[unitInd, "Number of Waveforms"]
+                waveformFWHM = unit_stats_df.at[unitInd, "Valley FWHM of Unit Template"]
+                waveformPeakMinusTrough = unit_stats_df.at[unitInd, "Peak-Valley of Unit Template"]
                 nwbfile.add_unit(
                     spike_times=spike_times,
                     electrode_group=electrode_group,
@@ -45,7 +45,10 @@ class Olson2024SpikeGadgetsLFPInterface(BaseDataInterface):
 
     def add_to_nwbfile(self, nwbfile: NWBFile, metadata: dict, stub_test: bool = False):
         folder_path = Path(self.source_data["folder_path"])
-        electrodes_table = nwbfile.electrodes.to_dataframe()
+        hasLFPs = nwbfile.electrodes["hasLFP"][:]
+        chID_to_electrode_index = {}
+        for electrode_index, chID in enumerate(nwbfile.electrodes["chID"][:]):
+            chID_to_electrode_index.setdefault(chID, electrode_index)
         lfp_data, lfp_electrodes, conversions = [], [], []
         for file_path in folder_path.glob("*.dat"):
             if file_path.name.startswith("._") or file_path.stem == "SL18_D19.timestamps":
@@ -56,10 +59,8 @@ class Olson2024SpikeGadgetsLFPInterface(BaseDataInterface):
             channel_number = file_path.stem.split("ch")[-1]
             trode_number = file_path.stem.split("ch")[0].split("nt")[-1]
             chID = f"nTrode{trode_number}_elec{channel_number}"
-            channel_index = electrodes_table.index[electrodes_table.chID == chID][0]
-            assert electrodes_table.hasLFP[
-                channel_index
-            ], f"Channel {chID} has LFP data, but is not marked as an LFP channel."
+            channel_index = chID_to_electrode_index[chID]
+            assert hasLFPs[channel_index], f"Channel {chID} has LFP data, but is not marked as an LFP channel."
             lfp_electrodes.append(channel_index)
             lfp_data.append(data)
             conversions.append(conversion)
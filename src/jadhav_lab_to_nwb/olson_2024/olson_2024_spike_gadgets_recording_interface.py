@@ -141,15 +141,13 @@ class Olson2024SingleEpochSpikeGadgetsRecordingInterface(SpikeGadgetsRecordingIn
         metadata = self.reformat_metadata(metadata)
         channel_ids = self.recording_extractor.get_channel_ids()
         channel_names = self.recording_extractor.get_property(key="channel_name", ids=channel_ids)
+        group_name_to_location = {group["name"]: group["location"] for group in metadata["Ecephys"]["ElectrodeGroup"]}
         group_names, chIDs, hasLFPs, locations = [], [], [], []
         for channel_name in channel_names:
             hwChan = channel_name.split("hwChan")[-1]
             nTrode = self.hwChan_to_nTrode[hwChan]
             hasLFP = self.hwChan_to_hasLFP[hwChan]
-            electrode_group = next(
-                group for group in metadata["Ecephys"]["ElectrodeGroup"] if group["name"] == f"nTrode{nTrode}"
-            )
-            location = electrode_group["location"]
+            location = group_name_to_location[f"nTrode{nTrode}"]
             trode_chan = self.nTrode_to_hwChans[nTrode].index(hwChan) + 1
 
             group_names.append(f"nTrode{nTrode}")
@@ -1,6 +1,7 @@
 """Primary class for converting experiment-specific behavioral video."""
 from pynwb.file import NWBFile
 from pydantic import FilePath
+from concurrent.futures import ThreadPoolExecutor
 
 from neuroconv.utils import DeepDict, dict_deep_update
 from neuroconv.basedatainterface import BaseDataInterface
@@ -21,15 +22,17 @@ class Olson2024VideoInterface(BaseDataInterface):
         assert len(file_paths) == len(
             video_timestamps_file_paths
         ), "The number of file paths must match the number of video timestamps file paths."
-        video_interfaces = []
-        for file_path, video_timestamps_file_path in zip(file_paths, video_timestamps_file_paths):
-            epoch_name = get_epoch_name(name=file_path.parent.name)
-            metadata_key_name = "Video" + "_" + epoch_name  # TODO: Document this naming convention in the docstring
-            video_interface = VideoInterface(file_paths=[file_path], metadata_key_name=metadata_key_name)
-            timestamps, _ = readCameraModuleTimeStamps(video_timestamps_file_path)
+        # The timestamps files are independent, so read them concurrently to overlap the file I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(video_timestamps_file_paths))) as executor:
+            timestamps_per_file = list(executor.map(readCameraModuleTimeStamps, video_timestamps_file_paths))
+        epoch_names = [get_epoch_name(name=file_path.parent.name) for file_path in file_paths]
+        # TODO: Document the Video_{epoch_name} metadata key naming convention in the docstring
+        self.video_interfaces = [
+            VideoInterface(file_paths=[file_path], metadata_key_name=f"Video_{epoch_name}")
+            for file_path, epoch_name in zip(file_paths, epoch_names)
+        ]
+        for video_interface, (timestamps, _) in zip(self.video_interfaces, timestamps_per_file):
             video_interface.set_aligned_timestamps(aligned_timestamps=[timestamps])
-            video_interfaces.append(video_interface)
-        self.video_interfaces = video_interfaces
 
     def get_metadata(self) -> DeepDict:
         metadata = super().get_metadata()
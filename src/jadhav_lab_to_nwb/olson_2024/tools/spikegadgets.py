@@ -1,5 +1,6 @@
 """Useful tools for dealing with spikegadgets data."""
 from pydantic import FilePath
+from functools import lru_cache
 import numpy as np
 import re
 
@@ -62,7 +63,7 @@ def parseFields(fieldstr: str) -> np.dtype:
         The fields string as a numpy dtype.
     """
     # Returns np.dtype from field string
-    sep = re.split("\s", re.sub(r"\>\<|\>|\<", " ", fieldstr).strip())
+    sep = re.split(r"\s", re.sub(r"\>\<|\>|\<", " ", fieldstr).strip())
     # print(sep)
     typearr = []
     # Every two elmts is fieldname followed by datatype
@@ -72,7 +73,7 @@ def parseFields(fieldstr: str) -> np.dtype:
         ftype = "uint32"
         # Finds if a <num>* is included in datatype
         if sep[i + 1].__contains__("*"):
-            temptypes = re.split("\*", sep[i + 1])
+            temptypes = sep[i + 1].split("*")
             # Results in the correct assignment, whether str is num*dtype or dtype*num
             ftype = temptypes[temptypes[0].isdigit()]
             repeats = int(temptypes[temptypes[1].isdigit()])
@@ -88,6 +89,7 @@ def parseFields(fieldstr: str) -> np.dtype:
     return np.dtype(typearr)
 
 
+@lru_cache(maxsize=128)
 def readCameraModuleTimeStamps(file_path: FilePath) -> tuple[np.ndarray, float]:
     """
     Read the timestamps from a .videoTimeStamps file.
@@ -101,6 +103,9 @@ def readCameraModuleTimeStamps(file_path: FilePath) -> tuple[np.ndarray, float]:
     The header length switches, so reading lines seems more reliable..
     Encoding appears to be latin-1, not UTF-8.
 
+    The video, DLC, and epoch interfaces all read the same files, so results are cached per file path
+    and shared between callers. session_to_nwb clears the cache after each conversion.
+
     Parameters
     ----------
     file_path : str
@@ -110,6 +115,7 @@ def readCameraModuleTimeStamps(file_path: FilePath) -> tuple[np.ndarray, float]:
     -------
     tuple[np.ndarray, float]
         The timestamps and the clock rate.
+        The timestamps array is read-only; copy it before modifying it in place.
     """
     CLOCK_STRING = "Clock rate: "
     HEADER_END_STRING = "End settings"
@@ -122,4 +128,5 @@ def readCameraModuleTimeStamps(file_path: FilePath) -> tuple[np.ndarray, float]:
             elif header_text.find(HEADER_END_STRING) != -1:
                 break
         timestamps = np.fromfile(fid, dtype=np.uint32) / clock_rate
+    timestamps.flags.writeable = False
     return timestamps, clock_rate
@@ -3,6 +3,6 @@
 
 def get_epoch_name(name: str) -> str:
     """Get the epoch name from the file or folder name."""
-    split_name = name.split("_")
+    split_name = name.split("_", 6)  # only fields 2-5 are needed, so don't split the rest of the name
     epoch_name = "_".join(split_name[2:6])
     return epoch_name